@@ -1,19 +1,28 @@
 import nodemailer from "nodemailer";
 
 import { getApiKeyStatus, getSmtpConfigByApiKey } from "@/lib/api-key";
+import { fetchAttachment } from "@/lib/attachment-cache";
 import { createEmail } from "@/lib/emails";
 import { decrypt } from "@/lib/pwd";
+import {
+  emailRegex,
+  formatRecipient,
+  MAX_RECIPIENTS,
+  normalizeRecipients,
+  RecipientStatus,
+} from "@/lib/recipients";
 
 type emailContent = {
   fromName?: string;
   fromEmail: string;
-  to: string;
+  to: string | string[]; // addresses may include display names: "Jane <jane@x.com>"
   subject: string;
   text?: string;
   html?: string;
   replyTo?: string;
-  cc?: string;
-  bcc?: string;
+  cc?: string | string[];
+  bcc?: string | string[];
+  fanOut?: "single" | "separate"; // one message for all, or one per 'to' recipient
   attachments?: Array<{
     filename: string;
     content?: string;  // base64 encoded content (optional if url is provided)
@@ -103,7 +112,13 @@ export const POST = async (req: Request) => {
       },
     );
   }
-  if (!message.to) {
+  // Normalize recipients, dropping duplicates across to/cc/bcc
+  const seen = new Set<string>();
+  const to = normalizeRecipients(message.to, seen);
+  const cc = normalizeRecipients(message.cc, seen);
+  const bcc = normalizeRecipients(message.bcc, seen);
+
+  if (to.length === 0) {
     return new Response(
       JSON.stringify({ error: "Missing required field 'to'." }),
       {
@@ -131,9 +146,61 @@ export const POST = async (req: Request) => {
     );
   }
 
+  if (to.length + cc.length + bcc.length > MAX_RECIPIENTS) {
+    return new Response(
+      JSON.stringify({
+        error: `Too many recipients. A maximum of ${MAX_RECIPIENTS} is allowed.`,
+      }),
+      {
+        status: 400,
+        headers: { "Content-Type": "application/json" },
+      },
+    );
+  }
+
+  for (const [field, recipients] of [
+    ["to", to],
+    ["cc", cc],
+    ["bcc", bcc],
+  ] as const) {
+    const invalid = recipients.find((r) => !emailRegex.test(r.address));
+    if (invalid) {
+      return new Response(
+        JSON.stringify({
+          error: `Invalid '${field}' email format: ${invalid.address || invalid.name}`,
+        }),
+        {
+          status: 400,
+          headers: { "Content-Type": "application/json" },
+        },
+      );
+    }
+  }
+
+  const fanOut = message.fanOut || "single";
+  if (fanOut !== "single" && fanOut !== "separate") {
+    return new Response(
+      JSON.stringify({ error: "Invalid 'fanOut'. Use 'single' or 'separate'." }),
+      {
+        status: 400,
+        headers: { "Content-Type": "application/json" },
+      },
+    );
+  }
+  if (fanOut === "separate" && (cc.length > 0 || bcc.length > 0)) {
+    return new Response(
+      JSON.stringify({
+        error: "'cc' and 'bcc' are not supported with fanOut 'separate'.",
+      }),
+      {
+        status: 400,
+        headers: { "Content-Type": "application/json" },
+      },
+    );
+  }
+
   // Validate replyTo if provided
   if (message.replyTo) {
-    const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
     if (!emailRegex.test(message.replyTo)) {
       return new Response(
         JSON.stringify({ error: "Invalid 'replyTo' email format." }),
@@ -300,6 +367,8 @@ export const POST = async (req: Request) => {
     host: smtpConfig.host,
     port: smtpConfig.port,
     secure: smtpConfig.security === "SSL", // Use SSL if the security is set to 'SSL'
+    // Reuse SMTP connections when sending one message per recipient
+    pool: fanOut === "separate" && to.length > 1,
     auth: {
       user: smtpConfig.user,
       pass: decryptedPassword,
@@ -326,37 +395,8 @@ export const POST = async (req: Request) => {
             // Decode base64 content to Buffer
             content = Buffer.from(attachment.content, 'base64');
           } else if (attachment.url) {
-            // Download content from URL and convert to Buffer
-            const controller = new AbortController();
-            const timeoutId = setTimeout(() => controller.abort(), 30000); // 30 second timeout
-            
-            try {
-              const response = await fetch(attachment.url, {
-                signal: controller.signal,
-                headers: {
-                  'User-Agent': 'Freesend/1.0'
-                }
-              });
-              clearTimeout(timeoutId);
-              
-              if (!response.ok) {
-                throw new Error(`Failed to fetch attachment from URL: ${response.statusText}`);
-              }
-              
-              // Check content length to prevent large file downloads
-              const contentLength = response.headers.get('content-length');
-              if (contentLength && parseInt(contentLength) > 25 * 1024 * 1024) { // 25MB limit
-                throw new Error(`Attachment file too large: ${Math.round(parseInt(contentLength) / 1024 / 1024)}MB (max 25MB)`);
-              }
-              
-              content = Buffer.from(await response.arrayBuffer());
-            } catch (error) {
-              clearTimeout(timeoutId);
-              if (error.name === 'AbortError') {
-                throw new Error(`Timeout fetching attachment from URL (30s limit)`);
-              }
-              throw error;
-            }
+            // Download through the shared cache (revalidated, size-limited)
+            content = await fetchAttachment(attachment.url);
           } else {
             // This case should ideally be caught by the validation above, but as a fallback
             throw new Error(`Attachment '${attachment.filename}' has no content or URL.`);
@@ -373,34 +413,94 @@ export const POST = async (req: Request) => {
       }) || []
     );
 
-    await transporter.sendMail({
+    const mailOptions = {
       from: fromField,
-      to: message.to,
       subject: message.subject,
       text: message.text,
       html: message.html,
       replyTo: message.replyTo,
-      cc: message.cc,
-      bcc: message.bcc,
       attachments: processedAttachments,
       headers: {
         'X-Mailer': 'Freesend',
         'X-Sent-By': 'Freesend Email API - https://freesend.metafog.io'
       }
-    });
+    };
     const attachmentString = JSON.stringify(message.attachments);
-    await createEmail(
-      token,
-      fromField,
-      message.to,
-      message.subject,
-      message.html,
-      message.text,
-      attachmentString,
-    );
+    let recipients: RecipientStatus[];
+
+    // The mail is already delivered when this runs, so a failed log write
+    // must not turn the request into an error (and invite a re-send)
+    const logEmail = async (toField: string) => {
+      try {
+        await createEmail(
+          token,
+          fromField,
+          toField,
+          message.subject,
+          message.html,
+          message.text,
+          attachmentString,
+        );
+      } catch (error) {
+        console.error("Error logging sent email:", error);
+      }
+    };
+
+    if (fanOut === "separate") {
+      // One message per recipient, sent over the pooled connections
+      recipients = await Promise.all(
+        to.map(async (recipient): Promise<RecipientStatus> => {
+          const address = recipient.address;
+          try {
+            await transporter.sendMail({ ...mailOptions, to: recipient });
+          } catch (error) {
+            return { email: address, status: "failed", error: error.message };
+          }
+          await logEmail(formatRecipient(recipient));
+          return { email: address, status: "sent" };
+        }),
+      );
+    } else {
+      // One SMTP transaction with a RCPT TO per recipient
+      const info = await transporter.sendMail({
+        ...mailOptions,
+        to,
+        cc,
+        bcc,
+      });
+      const rejected = new Set(
+        (info.rejected || []).map((address) => String(address).toLowerCase()),
+      );
+      recipients = [...to, ...cc, ...bcc].map(({ address }): RecipientStatus =>
+        rejected.has(address.toLowerCase())
+          ? { email: address, status: "failed", error: "Recipient rejected" }
+          : { email: address, status: "sent" },
+      );
+      await logEmail(to.map(formatRecipient).join(", "));
+    }
+
+    const sent = recipients.filter((r) => r.status === "sent").length;
+    if (sent === 0) {
+      return new Response(
+        JSON.stringify({
+          error: "Error sending email: no recipients accepted the message",
+          recipients,
+        }),
+        {
+          status: 500,
+          headers: { "Content-Type": "application/json" },
+        },
+      );
+    }
 
     return new Response(
-      JSON.stringify({ message: "Email sent successfully" }),
+      JSON.stringify({
+        message:
+          sent === recipients.length
+            ? "Email sent successfully"
+            : `Email sent to ${sent} of ${recipients.length} recipients`,
+        recipients,
+      }),
       {
         status: 200,
         headers: { "Content-Type": "application/json" },
@@ -415,5 +515,8 @@ export const POST = async (req: Request) => {
         headers: { "Content-Type": "application/json" },
       },
     );
+  } finally {
+    // Releases pooled SMTP connections on every path, including errors
+    transporter.close();
   }
 };
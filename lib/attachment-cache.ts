@@ -0,0 +1,138 @@
+// Shared cache for attachments referenced by URL in /api/send-email.
+//
+// Bodies are kept in a byte-bounded LRU and revalidated with the origin's
+// ETag / Last-Modified validators, so a campaign that references the same
+// hosted file thousands of times downloads it once. Concurrent fetches of
+// the same URL share a single in-flight download.
+
+export const MAX_ATTACHMENT_BYTES = 25 * 1024 * 1024; // 25MB limit
+const FETCH_TIMEOUT_MS = 30000; // 30 second timeout
+const MAX_CACHE_BYTES = 200 * 1024 * 1024;
+
+type CacheEntry = {
+  content: Buffer;
+  etag?: string;
+  lastModified?: string;
+};
+
+// Map iteration order is insertion order, so re-inserting on access keeps
+// the least recently used entry at the front.
+const cache = new Map<string, CacheEntry>();
+const inFlight = new Map<string, Promise<Buffer>>();
+let cachedBytes = 0;
+
+const tooLarge = (bytes: number) =>
+  new Error(
+    `Attachment file too large: ${Math.round(bytes / 1024 / 1024)}MB (max 25MB)`,
+  );
+
+function touch(url: string, entry: CacheEntry) {
+  cache.delete(url);
+  cache.set(url, entry);
+}
+
+function evict(url: string) {
+  const entry = cache.get(url);
+  if (entry) {
+    cachedBytes -= entry.content.length;
+    cache.delete(url);
+  }
+}
+
+function store(url: string, entry: CacheEntry) {
+  evict(url);
+  if (entry.content.length > MAX_CACHE_BYTES) return;
+  cache.set(url, entry);
+  cachedBytes += entry.content.length;
+  for (const oldest of cache.keys()) {
+    if (cachedBytes <= MAX_CACHE_BYTES) break;
+    evict(oldest);
+  }
+}
+
+async function readBody(response: Response): Promise<Buffer> {
+  // Reject early when the server announces an oversized body
+  const contentLength = response.headers.get("content-length");
+  if (contentLength && parseInt(contentLength) > MAX_ATTACHMENT_BYTES) {
+    throw tooLarge(parseInt(contentLength));
+  }
+
+  if (!response.body) {
+    return Buffer.alloc(0);
+  }
+
+  // Enforce the limit as bytes arrive, content-length may be absent or wrong
+  const reader = response.body.getReader();
+  const chunks: Uint8Array[] = [];
+  let received = 0;
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    received += value.byteLength;
+    if (received > MAX_ATTACHMENT_BYTES) {
+      await reader.cancel();
+      throw tooLarge(received);
+    }
+    chunks.push(value);
+  }
+  return Buffer.concat(chunks, received);
+}
+
+async function download(url: string): Promise<Buffer> {
+  const cached = cache.get(url);
+  const headers: Record<string, string> = { "User-Agent": "Freesend/1.0" };
+  if (cached?.etag) headers["If-None-Match"] = cached.etag;
+  if (cached?.lastModified) headers["If-Modified-Since"] = cached.lastModified;
+
+  const controller = new AbortController();
+  const timeoutId = setTimeout(() => controller.abort(), FETCH_TIMEOUT_MS);
+
+  try {
+    const response = await fetch(url, {
+      signal: controller.signal,
+      headers,
+    });
+
+    if (response.status === 304 && cached) {
+      touch(url, cached);
+      return cached.content;
+    }
+
+    if (!response.ok) {
+      throw new Error(
+        `Failed to fetch attachment from URL: ${response.statusText}`,
+      );
+    }
+
+    const content = await readBody(response);
+    const etag = response.headers.get("etag") || undefined;
+    const lastModified = response.headers.get("last-modified") || undefined;
+    const noStore = /no-store/i.test(
+      response.headers.get("cache-control") || "",
+    );
+
+    // Without validators there is no way to revalidate, so don't keep it
+    if ((etag || lastModified) && !noStore) {
+      store(url, { content, etag, lastModified });
+    } else {
+      evict(url);
+    }
+    return content;
+  } catch (error) {
+    if (error.name === "AbortError") {
+      throw new Error(`Timeout fetching attachment from URL (30s limit)`);
+    }
+    throw error;
+  } finally {
+    clearTimeout(timeoutId);
+  }
+}
+
+export function fetchAttachment(url: string): Promise<Buffer> {
+  const pending = inFlight.get(url);
+  if (pending) return pending;
+
+  const promise = download(url).finally(() => inFlight.delete(url));
+  inFlight.set(url, promise);
+  return promise;
+}
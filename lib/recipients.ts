@@ -0,0 +1,65 @@
+import addressparser from "nodemailer/lib/addressparser";
+
+export const MAX_RECIPIENTS = 1000;
+
+export const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+
+export type Recipient = {
+  name: string;
+  address: string;
+};
+
+export type RecipientStatus = {
+  email: string;
+  status: "sent" | "failed";
+  error?: string;
+};
+
+type ParsedAddress = {
+  name: string;
+  address?: string;
+  group?: ParsedAddress[];
+};
+
+function flatten(parsed: ParsedAddress[]): Recipient[] {
+  const recipients: Recipient[] = [];
+  for (const entry of parsed) {
+    if (entry.group) {
+      recipients.push(...flatten(entry.group));
+    } else {
+      recipients.push({ name: entry.name || "", address: entry.address || "" });
+    }
+  }
+  return recipients;
+}
+
+// Parse a to/cc/bcc field (string, address list or array of either) the same
+// way nodemailer does, so `"Doe, Jane" <jane@x.com>` stays one recipient.
+// Duplicate addresses are dropped; `seen` holds lowercased addresses already
+// used in another field so nobody receives the same message twice.
+export function normalizeRecipients(
+  value: unknown,
+  seen: Set<string> = new Set(),
+): Recipient[] {
+  if (!value) return [];
+
+  const entries = Array.isArray(value) ? value : [value];
+  const recipients: Recipient[] = [];
+  for (const entry of entries) {
+    if (!entry) continue;
+    for (const recipient of flatten(addressparser(String(entry)))) {
+      const key = recipient.address.toLowerCase();
+      if (!recipient.address && !recipient.name) continue;
+      if (recipient.address && seen.has(key)) continue;
+      if (recipient.address) seen.add(key);
+      recipients.push(recipient);
+    }
+  }
+  return recipients;
+}
+
+export function formatRecipient(recipient: Recipient): string {
+  return recipient.name
+    ? `"${recipient.name.replace(/"/g, '\\"')}" <${recipient.address}>`
+    : recipient.address;
+}
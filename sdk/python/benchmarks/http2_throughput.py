@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for the HTTP/1.1 and HTTP/2 transports.
+
+Starts two local stand-ins for /api/send-email, one speaking HTTP/1.1
+and one speaking cleartext HTTP/2 (via h2), each answering after a fixed
+delay to mimic SMTP latency. The same number of concurrent sends is then
+pushed through each transport, and the script reports throughput and how
+many sockets the server had to accept.
+
+Requires the package with its HTTP/2 extra (``pip install -e ".[http2]"``).
+
+Usage:
+    python benchmarks/http2_throughput.py [--requests N] [--concurrency N] [--delay MS]
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import h2.config
+import h2.connection
+import h2.events
+
+from freesend import Freesend, FreesendConfig, SendEmailRequest
+
+RESPONSE_BODY = json.dumps({"message": "Email sent successfully"}).encode("utf-8")
+
+
+class ServerStats:
+    """Sockets accepted and HTTP/2 streams in flight, as seen by a stand-in server."""
+
+    def __init__(self):
+        self.count = 0
+        self.streams = 0
+        self.peak_streams = 0
+        self.lock = threading.Lock()
+
+    def increment(self):
+        with self.lock:
+            self.count += 1
+
+    def stream_started(self):
+        with self.lock:
+            self.streams += 1
+            self.peak_streams = max(self.peak_streams, self.streams)
+
+    def stream_finished(self):
+        with self.lock:
+            self.streams -= 1
+
+
+def start_http1_server(delay: float, counter: ServerStats) -> str:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            counter.increment()
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            time.sleep(delay)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(RESPONSE_BODY)))
+            self.end_headers()
+            self.wfile.write(RESPONSE_BODY)
+
+        def log_message(self, format, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        request_queue_size = 1024
+
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+class H2Protocol(asyncio.Protocol):
+    """Minimal cleartext HTTP/2 server answering every POST after a delay."""
+
+    def __init__(self, delay: float, counter: ServerStats):
+        self.delay = delay
+        self.counter = counter
+        self.conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.counter.increment()
+        self.transport = transport
+        self.conn.initiate_connection()
+        self.transport.write(self.conn.data_to_send())
+
+    def data_received(self, data):
+        for event in self.conn.receive_data(data):
+            if isinstance(event, h2.events.DataReceived):
+                self.conn.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+            elif isinstance(event, h2.events.StreamEnded):
+                self.counter.stream_started()
+                asyncio.ensure_future(self.respond(event.stream_id))
+        self.transport.write(self.conn.data_to_send())
+
+    async def respond(self, stream_id: int):
+        await asyncio.sleep(self.delay)
+        self.conn.send_headers(stream_id, [
+            (":status", "200"),
+            ("content-type", "application/json"),
+            ("content-length", str(len(RESPONSE_BODY))),
+        ])
+        self.conn.send_data(stream_id, RESPONSE_BODY, end_stream=True)
+        self.transport.write(self.conn.data_to_send())
+        self.counter.stream_finished()
+
+
+def start_http2_server(delay: float, counter: ServerStats) -> str:
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(
+        loop.create_server(lambda: H2Protocol(delay, counter), "127.0.0.1", 0)
+    )
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+
+def run_load(get_client, total: int, concurrency: int) -> float:
+    """Send ``total`` emails from ``concurrency`` threads; returns elapsed seconds."""
+    email = SendEmailRequest(
+        fromEmail="bench@example.com",
+        to="recipient@example.com",
+        subject="Benchmark",
+        text="Benchmark",
+    )
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for future in [executor.submit(lambda: get_client().send_email(email)) for _ in range(total)]:
+            future.result()
+    return time.monotonic() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000, help="Emails per transport (default: %(default)s)")
+    parser.add_argument("--concurrency", type=int, default=64, help="Concurrent sends (default: %(default)s)")
+    parser.add_argument("--delay", type=float, default=20, help="Simulated server latency in ms (default: %(default)s)")
+    args = parser.parse_args()
+    delay = args.delay / 1000
+
+    # HTTP/1.1: one requests-backed client per worker thread, as the CLI does
+    http1_counter = ServerStats()
+    http1_url = start_http1_server(delay, http1_counter)
+    local = threading.local()
+
+    def http1_client():
+        if not hasattr(local, "client"):
+            local.client = Freesend(FreesendConfig(api_key="benchmark", base_url=http1_url))
+        return local.client
+
+    http1_elapsed = run_load(http1_client, args.requests, args.concurrency)
+
+    # HTTP/2: one client shared by every thread. The stand-in is cleartext,
+    # so HTTP/2 is spoken with prior knowledge rather than negotiated.
+    http2_counter = ServerStats()
+    http2_url = start_http2_server(delay, http2_counter)
+    shared = Freesend(FreesendConfig(
+        api_key="benchmark",
+        base_url=http2_url,
+        transport="http2",
+        http2_prior_knowledge=True,
+    ))
+
+    http2_elapsed = run_load(lambda: shared, args.requests, args.concurrency)
+
+    print(f"{args.requests} emails, concurrency {args.concurrency}, server latency {args.delay:g}ms\n")
+    print(f"{'transport':<22} {'emails/s':>10} {'sockets':>8}")
+    for label, elapsed, counter in (
+        ("HTTP/1.1 (requests)", http1_elapsed, http1_counter),
+        ("HTTP/2 (httpx)", http2_elapsed, http2_counter),
+    ):
+        print(f"{label:<22} {args.requests / elapsed:>10.0f} {counter.count:>8}")
+
+
+if __name__ == "__main__":
+    main()
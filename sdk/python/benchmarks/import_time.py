@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Import-time and memory benchmark for the Freesend Python SDK.
+
+Runs each scenario in a fresh interpreter with ``python -X importtime``
+and reports the total import time and the peak resident memory, so the
+effect of lazy imports and the ``http.client`` transport on cold start
+can be compared.
+
+Usage:
+    python benchmarks/import_time.py [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "baseline (python only)": "pass",
+    "import freesend": "import freesend",
+    "client, http.client transport": (
+        "from freesend import Freesend, FreesendConfig\n"
+        "Freesend(FreesendConfig(api_key='k', transport='http.client'))"
+    ),
+    "client, requests transport": (
+        "from freesend import Freesend, FreesendConfig\n"
+        "Freesend(FreesendConfig(api_key='k', transport='requests'))"
+    ),
+}
+
+# Printed by the child after the scenario so peak RSS covers the imports
+REPORT_RSS = (
+    "\nimport resource, sys\n"
+    "rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+    "print(rss // 1024 if sys.platform == 'darwin' else rss)\n"
+)
+
+
+def measure(code: str, cwd: str):
+    """Return (import time in ms, peak RSS in KiB) for one fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code + REPORT_RSS],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like "import time:   self [us] | cumulative | name"; summing
+    # top-level (unindented) cumulative times gives the total import cost
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000, int(result.stdout.split()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10, help="Runs per scenario (default: %(default)s)")
+    args = parser.parse_args()
+
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    print(f"{'scenario':<34} {'import ms':>10} {'peak RSS MiB':>13}")
+    for label, code in SCENARIOS.items():
+        samples = [measure(code, package_root) for _ in range(args.runs)]
+        import_ms = statistics.median(s[0] for s in samples)
+        rss_mib = statistics.median(s[1] for s in samples) / 1024
+        print(f"{label:<34} {import_ms:>10.1f} {rss_mib:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,43 @@
 Freesend Python SDK
 
 Official Python SDK for the Freesend email API.
+
+Public names are imported on first access, so ``import freesend`` stays
+cheap for short-lived processes that may never send anything.
 """
 
-from .client import Freesend
-from .exceptions import FreesendError
-from .types import Attachment, SendEmailRequest, SendEmailResponse, FreesendConfig
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .client import Freesend
+    from .exceptions import FreesendError
+    from .types import Attachment, SendEmailRequest, SendEmailResponse, RecipientStatus, FreesendConfig, ValidationReport
+    from .validation import validate_many
 
 __version__ = "1.0.0"
-__all__ = ["Freesend", "FreesendError", "Attachment", "SendEmailRequest", "SendEmailResponse", "FreesendConfig"] 
\ No newline at end of file
+__all__ = ["Freesend", "FreesendError", "Attachment", "SendEmailRequest", "SendEmailResponse", "RecipientStatus", "FreesendConfig", "ValidationReport", "validate_many"]
+
+_LAZY_IMPORTS = {
+    "Freesend": ".client",
+    "FreesendError": ".exceptions",
+    "Attachment": ".types",
+    "SendEmailRequest": ".types",
+    "SendEmailResponse": ".types",
+    "RecipientStatus": ".types",
+    "FreesendConfig": ".types",
+    "ValidationReport": ".types",
+    "validate_many": ".validation",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
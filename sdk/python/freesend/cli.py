@@ -0,0 +1,441 @@
+"""
+Command-line bulk sender for the Freesend Python SDK.
+
+Streams recipients from a CSV or JSONL file, renders each row into a
+SendEmailRequest and sends them with bounded concurrency. Every row's
+outcome is appended to a JSONL result log, which ``--resume`` reads back
+so an interrupted run skips rows that were already sent.
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Set, TextIO, Tuple
+
+from .client import Freesend
+from .exceptions import FreesendError
+from .transport import HTTP2Transport
+from .types import FreesendConfig, SendEmailRequest
+
+# SendEmailRequest fields that can be templated from a row
+TEMPLATE_FIELDS = (
+    "fromEmail", "fromName", "to", "subject", "text", "html", "replyTo", "cc", "bcc",
+)
+
+# {{column}} placeholders; single braces (CSS, JSON, ...) are left untouched
+PLACEHOLDER_RE = re.compile(r"\{\{\s*([^{}]+?)\s*\}\}")
+
+
+def render_template(template: str, row: Dict[str, Any]) -> str:
+    """
+    Replace ``{{column}}`` placeholders with the row's values.
+
+    Column names are looked up literally, never evaluated, so names such as
+    ``{{x.__class__}}`` are simply missing columns.
+
+    Raises:
+        FreesendError: If a placeholder names a column the row does not have
+    """
+    def substitute(match: "re.Match") -> str:
+        column = match.group(1)
+        if column not in row or row[column] is None:
+            raise FreesendError(f"Missing column '{column}' for template")
+        return str(row[column])
+
+    return PLACEHOLDER_RE.sub(substitute, template)
+
+
+class MalformedRow:
+    """Placeholder yielded for an input line that could not be parsed."""
+
+    def __init__(self, error: str):
+        self.error = error
+
+
+def iter_rows(path: str, fmt: Optional[str] = None) -> Iterator[Any]:
+    """
+    Lazily yield rows from a CSV or JSONL file.
+
+    Args:
+        path: Input file path, or "-" for stdin
+        fmt: "csv" or "jsonl"; inferred from the file extension when omitted
+
+    Yields:
+        One dictionary per row, or a MalformedRow for a JSONL line that is
+        not a JSON object (so the row is logged as failed, not fatal)
+    """
+    if fmt is None:
+        fmt = "jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv"
+
+    # utf-8-sig drops the byte-order mark spreadsheet exports start with,
+    # which would otherwise end up in the first column name
+    handle = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8-sig")
+    try:
+        if fmt == "csv":
+            for row in csv.DictReader(handle):
+                yield row
+        else:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield MalformedRow(f"Invalid JSON: {e}")
+                    continue
+                if isinstance(row, dict):
+                    yield row
+                else:
+                    yield MalformedRow("Invalid JSON: expected an object")
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def render_request(row: Dict[str, Any], templates: Dict[str, str]) -> SendEmailRequest:
+    """
+    Build a SendEmailRequest from a row.
+
+    Fields with a template are rendered with render_template against the
+    row's columns; other fields are taken from a column of the same name.
+
+    Args:
+        row: Input row
+        templates: Mapping of SendEmailRequest field name to template
+
+    Returns:
+        SendEmailRequest for this row
+    """
+    fields: Dict[str, Any] = {}
+    for name in TEMPLATE_FIELDS:
+        if name in templates:
+            fields[name] = render_template(templates[name], row)
+        else:
+            value = row.get(name)
+            fields[name] = value if value not in ("", None) else None
+
+    return SendEmailRequest(
+        fromEmail=fields.pop("fromEmail") or "",
+        to=fields.pop("to") or "",
+        subject=fields.pop("subject") or "",
+        **fields,
+    )
+
+
+def load_completed(log_path: str) -> Set[int]:
+    """
+    Read a previous result log and return the row numbers that were sent.
+
+    Args:
+        log_path: Path to a JSONL result log
+
+    Returns:
+        Set of row numbers whose status is "sent"
+    """
+    completed: Set[int] = set()
+    if not os.path.exists(log_path):
+        return completed
+
+    with open(log_path, encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # A run killed mid-write can leave a truncated last line
+                continue
+            if entry.get("status") == "sent":
+                completed.add(entry["row"])
+    return completed
+
+
+class RateLimiter:
+    """Spaces calls evenly so that at most ``rate`` start per second."""
+
+    def __init__(self, rate: Optional[float]):
+        self.interval = 1.0 / rate if rate else 0.0
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class Progress:
+    """Tracks throughput and latency and periodically reports them."""
+
+    def __init__(self, stream: Optional[TextIO] = None, interval: float = 1.0):
+        self.stream = stream
+        self.interval = interval
+        self.started = time.monotonic()
+        self.last_report = 0.0
+        self.sent = 0
+        self.failed = 0
+        self.skipped = 0
+        self.latencies: deque = deque(maxlen=1000)
+
+    def record(self, ok: bool, latency: float) -> None:
+        if ok:
+            self.sent += 1
+        else:
+            self.failed += 1
+        self.latencies.append(latency)
+        now = time.monotonic()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self.report()
+
+    def summary(self) -> str:
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        done = self.sent + self.failed
+        line = (
+            f"sent={self.sent} failed={self.failed} skipped={self.skipped} "
+            f"rate={done / elapsed:.1f}/s"
+        )
+        if self.latencies:
+            ordered = sorted(self.latencies)
+            p50 = ordered[len(ordered) // 2]
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+            line += f" p50={p50 * 1000:.0f}ms p95={p95 * 1000:.0f}ms"
+        return line
+
+    def report(self, final: bool = False) -> None:
+        if self.stream is None:
+            return
+        self.stream.write("\r" + self.summary() + ("\n" if final else ""))
+        self.stream.flush()
+
+
+def _shared_client(config: FreesendConfig) -> Optional[Freesend]:
+    """Return one client for every worker if it multiplexes over HTTP/2, else None."""
+    if config.transport != "http2":
+        return None
+    client = Freesend(config)
+    if isinstance(client.transport, HTTP2Transport):
+        return client
+    # http2 fell back to requests, whose Session must not be shared
+    client.transport.close()
+    return None
+
+
+def _send_row(
+    local: threading.local,
+    shared: Optional[Freesend],
+    config: FreesendConfig,
+    limiter: RateLimiter,
+    row: Dict[str, Any],
+    templates: Dict[str, str],
+) -> Tuple[Optional[str], str, float]:
+    """Render and send one row. Returns (error, recipient, latency)."""
+    # requests.Session is not guaranteed thread-safe, so each worker gets
+    # its own client unless a shared (multiplexing) one is given
+    client = shared or getattr(local, "client", None)
+    if client is None:
+        client = local.client = Freesend(config)
+
+    started = time.monotonic()
+    recipient = ""
+    try:
+        request = render_request(row, templates)
+        recipient = request.to
+        limiter.acquire()
+        started = time.monotonic()
+        client.send_email(request)
+        return None, recipient, time.monotonic() - started
+    except FreesendError as e:
+        return e.message, recipient, time.monotonic() - started
+    except Exception as e:
+        return f"Unexpected error: {e}", recipient, time.monotonic() - started
+
+
+def run(
+    rows: Iterator[Any],
+    config: FreesendConfig,
+    templates: Dict[str, str],
+    log: TextIO,
+    completed: Optional[Set[int]] = None,
+    concurrency: int = 8,
+    rate: Optional[float] = None,
+    progress: Optional[Progress] = None,
+) -> Progress:
+    """
+    Send one email per row, appending each outcome to ``log``.
+
+    At most ``2 * concurrency`` rows are held in memory at once, so input
+    size does not affect memory use.
+
+    Args:
+        rows: Iterator of input rows
+        config: Client configuration shared by all workers
+        templates: Field templates passed to render_request
+        log: Writable text stream for the JSONL result log
+        completed: Row numbers to skip (already sent in a previous run)
+        concurrency: Number of worker threads
+        rate: Maximum sends per second, or None for unlimited
+        progress: Progress tracker; a silent one is created when omitted
+
+    Returns:
+        The Progress tracker with final counts
+    """
+    completed = completed or set()
+    progress = progress or Progress()
+    limiter = RateLimiter(rate)
+    local = threading.local()
+    shared = _shared_client(config)
+    pending: Dict[Any, int] = {}
+
+    def record(row_number: int, error: Optional[str], recipient: Any, latency: float) -> None:
+        entry: Dict[str, Any] = {
+            "row": row_number,
+            "to": recipient,
+            "status": "failed" if error else "sent",
+            "latency_ms": round(latency * 1000, 1),
+        }
+        if error:
+            entry["error"] = error
+        log.write(json.dumps(entry) + "\n")
+        log.flush()
+        progress.record(error is None, latency)
+
+    def drain(block_until: int) -> None:
+        while len(pending) > block_until:
+            done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+            for future in done:
+                row_number = pending.pop(future)
+                record(row_number, *future.result())
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            try:
+                for row_number, row in enumerate(rows, start=1):
+                    if row_number in completed:
+                        progress.skipped += 1
+                        continue
+                    if isinstance(row, MalformedRow):
+                        record(row_number, row.error, "", 0.0)
+                        continue
+                    future = executor.submit(_send_row, local, shared, config, limiter, row, templates)
+                    pending[future] = row_number
+                    drain(concurrency * 2)
+            except KeyboardInterrupt:
+                # Drop rows that have not started and record the ones in flight,
+                # so a resumed run neither skips nor re-sends them
+                for future in list(pending):
+                    if future.cancel():
+                        del pending[future]
+                drain(0)
+                raise
+            drain(0)
+    finally:
+        if shared is not None:
+            shared.transport.close()
+
+    return progress
+
+
+def _ends_with_newline(path: str) -> bool:
+    with open(path, "rb") as handle:
+        handle.seek(-1, os.SEEK_END)
+        return handle.read(1) == b"\n"
+
+
+def _read_template(value: Optional[str]) -> Optional[str]:
+    """Allow ``@path`` to load a template from a file."""
+    if value and value.startswith("@"):
+        with open(value[1:], encoding="utf-8") as handle:
+            return handle.read()
+    return value
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="freesend",
+        description="Send one email per row of a CSV or JSONL file.",
+    )
+    parser.add_argument("input", help="CSV or JSONL file of recipients ('-' for stdin)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="Input format (default: from extension)")
+    parser.add_argument("--api-key", default=os.environ.get("FREESEND_API_KEY"), help="API key (default: $FREESEND_API_KEY)")
+    parser.add_argument("--base-url", default=os.environ.get("FREESEND_BASE_URL"), help="API base URL")
+    parser.add_argument("--transport", choices=["requests", "http.client", "http2"], help="HTTP transport (default: requests)")
+    parser.add_argument("--log", default="freesend-results.jsonl", help="Result log path (default: %(default)s)")
+    parser.add_argument("--resume", action="store_true", help="Skip rows already marked as sent in the result log")
+    parser.add_argument("--overwrite", action="store_true", help="Replace an existing result log instead of refusing to start")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent sends (default: %(default)s)")
+    parser.add_argument("--rate", type=float, help="Maximum sends per second")
+
+    templates = parser.add_argument_group(
+        "templates",
+        "Templates rendered per row, e.g. --subject 'Hi {{name}}'. "
+        "Prefix with @ to read from a file. Unset fields are read from a column of the same name.",
+    )
+    for name in TEMPLATE_FIELDS:
+        flag = "--" + "".join("-" + c.lower() if c.isupper() else c for c in name)
+        templates.add_argument(flag, dest=name, metavar="TEMPLATE")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if not args.api_key:
+        parser.error("an API key is required (--api-key or FREESEND_API_KEY)")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.resume and args.overwrite:
+        parser.error("--resume and --overwrite cannot be used together")
+    if not args.resume and not args.overwrite and os.path.exists(args.log) and os.path.getsize(args.log):
+        # Overwriting would lose the record of what an earlier run sent
+        parser.error(
+            f"result log {args.log} already exists; "
+            "use --resume to continue that run or --overwrite to replace it"
+        )
+
+    templates = {}
+    for name in TEMPLATE_FIELDS:
+        value = _read_template(getattr(args, name))
+        if value is not None:
+            templates[name] = value
+
+    completed = load_completed(args.log) if args.resume else set()
+    config = FreesendConfig(api_key=args.api_key, base_url=args.base_url, transport=args.transport)
+    progress = Progress(sys.stderr)
+
+    mode = "a" if args.resume else "w"
+    with open(args.log, mode, encoding="utf-8") as log:
+        if args.resume and log.tell() and not _ends_with_newline(args.log):
+            # Terminate a line truncated by the interrupted run
+            log.write("\n")
+        try:
+            run(
+                iter_rows(args.input, args.format),
+                config,
+                templates,
+                log,
+                completed=completed,
+                concurrency=args.concurrency,
+                rate=args.rate,
+                progress=progress,
+            )
+        except KeyboardInterrupt:
+            progress.report(final=True)
+            sys.stderr.write(f"Interrupted; rerun with --resume to continue from {args.log}\n")
+            return 130
+
+    progress.report(final=True)
+    return 1 if progress.failed else 0
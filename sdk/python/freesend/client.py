@@ -2,14 +2,23 @@
 Main client for the Freesend Python SDK.
 """
 
-import json
-import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
 
-import requests
+from .exceptions import FreesendError, FreesendAPIError, FreesendValidationError
+from .transport import create_transport
+from .types import SendEmailRequest, SendEmailResponse, RecipientStatus, Attachment, FreesendConfig, ValidationReport
+from .validation import normalize_recipients, validate_many, validate_request
 
-from .exceptions import FreesendError, FreesendAPIError, FreesendValidationError, FreesendNetworkError
-from .types import SendEmailRequest, SendEmailResponse, Attachment, FreesendConfig
+
+def __getattr__(name: str) -> Any:
+    # requests is only imported when the requests transport is used; keep
+    # ``freesend.client.requests`` resolvable for code that refers to it
+    if name == "requests":
+        import requests
+
+        return requests
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Freesend:
@@ -20,15 +29,20 @@ class Freesend:
         Initialize the Freesend client.
         
         Args:
-            config: Configuration object containing API key and optional base URL
+            config: Configuration object containing API key, optional base URL
+                and optional transport
         """
         self.api_key = config.api_key
         self.base_url = config.base_url or "https://freesend.metafog.io"
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.transport = create_transport(config, {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         })
+
+    @property
+    def session(self):
+        """The underlying requests.Session when using the requests transport."""
+        return getattr(self.transport, "session", None)
     
     def send_email(self, data: SendEmailRequest) -> SendEmailResponse:
         """
@@ -52,16 +66,16 @@ class Freesend:
         payload = self._prepare_payload(data)
         
         try:
-            response = self.session.post(
+            response = self.transport.post(
                 f"{self.base_url}/api/send-email",
-                json=payload,
+                payload,
                 timeout=30
             )
             
             # Parse the response
             try:
                 result = response.json()
-            except json.JSONDecodeError:
+            except ValueError:
                 raise FreesendAPIError("Invalid JSON response from server")
             
             # Check for errors
@@ -69,10 +83,19 @@ class Freesend:
                 error_message = result.get("error", "Unknown error occurred")
                 raise FreesendAPIError(error_message, response.status_code)
             
-            return SendEmailResponse(message=result.get("message", ""))
+            recipients = None
+            if result.get("recipients") is not None:
+                recipients = [
+                    RecipientStatus(
+                        email=r.get("email", ""),
+                        status=r.get("status", ""),
+                        error=r.get("error"),
+                    )
+                    for r in result["recipients"]
+                ]
+
+            return SendEmailResponse(message=result.get("message", ""), recipients=recipients)
             
-        except requests.exceptions.RequestException as e:
-            raise FreesendNetworkError(f"Network error: {str(e)}")
         except FreesendError:
             raise
         except Exception as e:
@@ -88,36 +111,46 @@ class Freesend:
         Raises:
             FreesendValidationError: If validation fails
         """
-        if not data.fromEmail:
-            raise FreesendValidationError("Missing required field: fromEmail")
-        
-        if not data.to:
-            raise FreesendValidationError("Missing required field: to")
-        
-        if not data.subject:
-            raise FreesendValidationError("Missing required field: subject")
-        
-        if not data.text and not data.html:
-            raise FreesendValidationError("Missing required field: text or html")
-        
-        # Validate email format
-        email_regex = r'^[^\s@]+@[^\s@]+\.[^\s@]+$'
-        if not re.match(email_regex, data.fromEmail):
-            raise FreesendValidationError("Invalid fromEmail format")
-        
-        if not re.match(email_regex, data.to):
-            raise FreesendValidationError("Invalid to email format")
-        
-        # Validate attachments if present
-        if data.attachments:
-            for attachment in data.attachments:
-                if not attachment.filename:
-                    raise FreesendValidationError("Attachment filename is required")
-                if not attachment.content and not attachment.url:
-                    raise FreesendValidationError("Attachment must have either content or url")
-                if attachment.content and attachment.url:
-                    raise FreesendValidationError("Attachment cannot have both content and url")
-    
+        errors = validate_request(data, urlsplit(self.base_url).hostname)
+        if errors:
+            raise FreesendValidationError(errors[0])
+
+    def validate_many(self, requests: Iterable[SendEmailRequest], **options: Any) -> ValidationReport:
+        """
+        Pre-flight a batch of requests against the server's rules without sending.
+
+        Args:
+            requests: Requests to validate
+            **options: Passed to freesend.validation.validate_many
+                (workers, chunk_size, max_errors)
+
+        Returns:
+            ValidationReport with counts and per-row errors
+        """
+        options.setdefault("host", urlsplit(self.base_url).hostname)
+        return validate_many(requests, **options)
+
+    def _normalize_recipient_fields(
+        self, data: SendEmailRequest
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Normalize and deduplicate to, cc and bcc across each other.
+
+        An address listed in an earlier field is dropped from later ones,
+        so nobody receives the same message twice.
+
+        Args:
+            data: Email request data
+
+        Returns:
+            Tuple of (to, cc, bcc) address lists
+        """
+        seen: set = set()
+        to = normalize_recipients(data.to, seen)
+        cc = normalize_recipients(data.cc, seen)
+        bcc = normalize_recipients(data.bcc, seen)
+        return to, cc, bcc
+
     def _prepare_payload(self, data: SendEmailRequest) -> Dict[str, Any]:
         """
         Prepare the payload for the API request.
@@ -128,9 +161,12 @@ class Freesend:
         Returns:
             Dictionary ready for JSON serialization
         """
+        to, cc, bcc = self._normalize_recipient_fields(data)
+
+        # A single address is sent as a plain string for older servers
         payload = {
             "fromEmail": data.fromEmail,
-            "to": data.to,
+            "to": to[0] if len(to) == 1 else to,
             "subject": data.subject,
         }
         
@@ -146,11 +182,14 @@ class Freesend:
         if data.replyTo:
             payload["replyTo"] = data.replyTo
 
-        if data.cc:
-            payload["cc"] = data.cc
+        if cc:
+            payload["cc"] = cc[0] if len(cc) == 1 else cc
+
+        if bcc:
+            payload["bcc"] = bcc[0] if len(bcc) == 1 else bcc
 
-        if data.bcc:
-            payload["bcc"] = data.bcc
+        if data.fanOut:
+            payload["fanOut"] = data.fanOut
 
         if data.attachments:
             payload["attachments"] = []
@@ -0,0 +1,267 @@
+"""
+HTTP transports for the Freesend Python SDK.
+
+The client talks to the API through a small transport interface so the
+HTTP stack can be chosen in FreesendConfig. ``requests`` remains the
+default; ``http.client`` uses only the standard library, which keeps
+import time and memory low for short-lived processes; ``http2`` multiplexes
+concurrent requests over one HTTP/2 connection (requires ``httpx[http2]``).
+"""
+
+import asyncio
+import http.client
+import json
+import select
+import threading
+import warnings
+import weakref
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from .exceptions import FreesendError, FreesendNetworkError
+from .types import FreesendConfig
+
+DEFAULT_TRANSPORT = "requests"
+DEFAULT_MAX_CONCURRENT_STREAMS = 100
+
+
+class TransportResponse:
+    """Minimal response object mirroring the parts of requests.Response the client uses."""
+
+    def __init__(self, status_code: int, body: bytes):
+        self.status_code = status_code
+        self.body = body
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode("utf-8"))
+
+
+class RequestsTransport:
+    """Transport backed by a pooled requests.Session."""
+
+    def __init__(self, headers: Dict[str, str]):
+        import requests
+
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+
+    def post(self, url: str, payload: Dict[str, Any], timeout: float):
+        import requests
+
+        try:
+            return self.session.post(url, json=payload, timeout=timeout)
+        except requests.exceptions.RequestException as e:
+            raise FreesendNetworkError(f"Network error: {str(e)}")
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class HTTPClientTransport:
+    """Transport using the standard library's http.client over one keep-alive connection."""
+
+    def __init__(self, headers: Dict[str, str]):
+        self.headers = headers
+        self.connection: Optional[http.client.HTTPConnection] = None
+        self.origin: Optional[tuple] = None
+
+    def _is_dropped(self) -> bool:
+        # An idle keep-alive socket only becomes readable when the server
+        # has closed it (or sent something unexpected); don't reuse it then
+        sock = self.connection.sock
+        if sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+    def _connect(self, scheme: str, netloc: str, timeout: float) -> http.client.HTTPConnection:
+        if self.connection is not None and self.origin == (scheme, netloc):
+            if not self._is_dropped():
+                self.connection.timeout = timeout
+                return self.connection
+
+        self.close()
+        if scheme == "https":
+            self.connection = http.client.HTTPSConnection(netloc, timeout=timeout)
+        else:
+            self.connection = http.client.HTTPConnection(netloc, timeout=timeout)
+        self.origin = (scheme, netloc)
+        return self.connection
+
+    def post(self, url: str, payload: Dict[str, Any], timeout: float) -> TransportResponse:
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        body = json.dumps(payload).encode("utf-8")
+
+        # A reused keep-alive connection may have been closed by the server
+        # while idle. Retry once only if writing the request failed; once the
+        # whole request is sent the email may have gone out, so never resend
+        for attempt in range(2):
+            reused = self.connection is not None
+            connection = self._connect(parts.scheme, parts.netloc, timeout)
+            try:
+                connection.request("POST", path, body=body, headers=self.headers)
+            except (ConnectionResetError, BrokenPipeError) as e:
+                self.close()
+                if reused and attempt == 0:
+                    continue
+                raise FreesendNetworkError(f"Network error: {str(e)}")
+            except (OSError, http.client.HTTPException) as e:
+                self.close()
+                raise FreesendNetworkError(f"Network error: {str(e)}")
+
+            try:
+                response = connection.getresponse()
+                data = response.read()
+            except (OSError, http.client.HTTPException) as e:
+                self.close()
+                raise FreesendNetworkError(f"Network error: {str(e)}")
+
+            if response.will_close:
+                self.close()
+            return TransportResponse(response.status, data)
+
+        raise FreesendNetworkError("Network error: connection closed")
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+            self.origin = None
+
+
+class HTTP2Transport:
+    """
+    Transport multiplexing requests over HTTP/2 with httpx.
+
+    One instance is safe to share between threads; concurrent requests
+    become streams on a single connection. httpcore's synchronous HTTP/2
+    connection can send streams out of order when used from several threads,
+    so the connection is owned by an httpx.AsyncClient running on one
+    event-loop thread, and post() hands requests to it.
+
+    The protocol is negotiated with ALPN, so servers without HTTP/2 (and
+    cleartext http:// URLs, unless prior knowledge is enabled) are spoken to
+    over HTTP/1.1 instead.
+    """
+
+    def __init__(
+        self,
+        headers: Dict[str, str],
+        max_concurrent_streams: Optional[int] = None,
+        prior_knowledge: bool = False,
+    ):
+        """
+        Args:
+            headers: Headers sent with every request
+            max_concurrent_streams: Maximum requests in flight at once
+            prior_knowledge: Speak HTTP/2 without negotiation (needed for
+                cleartext http:// servers; disables the HTTP/1.1 fallback)
+        """
+        import httpx
+
+        max_streams = max_concurrent_streams or DEFAULT_MAX_CONCURRENT_STREAMS
+        # Over HTTP/2 a connection that may negotiate h2 is shared while it is
+        # being set up, so this limit only comes into play on the HTTP/1.1
+        # fallback, where each in-flight request needs its own connection
+        self.client = httpx.AsyncClient(
+            http1=not prior_knowledge,
+            http2=True,
+            headers=headers,
+            limits=httpx.Limits(
+                max_connections=max_streams,
+                max_keepalive_connections=max_streams,
+            ),
+        )
+        self.streams = threading.BoundedSemaphore(max_streams)
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self.loop.run_forever, name="freesend-http2", daemon=True
+        )
+        self.thread.start()
+        # Stop the loop thread if the transport is dropped without close()
+        self._stop_loop = weakref.finalize(self, self.loop.call_soon_threadsafe, self.loop.stop)
+
+    def post(self, url: str, payload: Dict[str, Any], timeout: float) -> TransportResponse:
+        import httpx
+
+        with self.streams:
+            future = asyncio.run_coroutine_threadsafe(
+                self.client.post(url, json=payload, timeout=timeout), self.loop
+            )
+            try:
+                response = future.result()
+            except httpx.HTTPError as e:
+                raise FreesendNetworkError(f"Network error: {str(e)}")
+        return TransportResponse(response.status_code, response.content)
+
+    def close(self) -> None:
+        if not self._stop_loop.alive:
+            return
+        asyncio.run_coroutine_threadsafe(self.client.aclose(), self.loop).result()
+        self._stop_loop()
+        self.thread.join()
+        self.loop.close()
+
+
+TRANSPORTS = {
+    "requests": RequestsTransport,
+    "http.client": HTTPClientTransport,
+    "http2": HTTP2Transport,
+}
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        import httpx  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_transport(config: FreesendConfig, headers: Dict[str, str]):
+    """
+    Create the transport selected in FreesendConfig.
+
+    Args:
+        config: Client configuration
+        headers: Headers sent with every request
+
+    Returns:
+        Transport instance
+
+    Raises:
+        FreesendError: If the transport name is unknown
+    """
+    name = config.transport or DEFAULT_TRANSPORT
+    if name not in TRANSPORTS:
+        raise FreesendError(
+            f"Unknown transport '{name}'. Use one of: {', '.join(TRANSPORTS)}"
+        )
+
+    if name == "http2":
+        if _http2_available():
+            return HTTP2Transport(
+                headers,
+                max_concurrent_streams=config.max_concurrent_streams,
+                prior_knowledge=config.http2_prior_knowledge,
+            )
+        warnings.warn(
+            "The http2 transport requires 'pip install freesend[http2]'; "
+            "falling back to HTTP/1.1 with requests",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        name = DEFAULT_TRANSPORT
+    return TRANSPORTS[name](headers)
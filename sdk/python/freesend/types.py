@@ -2,8 +2,9 @@
 Type definitions for the Freesend Python SDK.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, List, Optional, Union
 
 
 @dataclass
@@ -21,15 +22,25 @@ class SendEmailRequest:
     """Request data for sending an email."""
     
     fromEmail: str
-    to: str
+    to: Union[str, List[str]]
     subject: str
     fromName: Optional[str] = None
     text: Optional[str] = None
     html: Optional[str] = None
     replyTo: Optional[str] = None
-    cc: Optional[str] = None
-    bcc: Optional[str] = None
+    cc: Optional[Union[str, List[str]]] = None
+    bcc: Optional[Union[str, List[str]]] = None
     attachments: Optional[List[Attachment]] = None
+    fanOut: Optional[str] = None  # "single" (one message, default) or "separate" (one per to recipient)
+
+
+@dataclass
+class RecipientStatus:
+    """Delivery status of a single recipient."""
+
+    email: str
+    status: str  # "sent" or "failed"
+    error: Optional[str] = None
 
 
 @dataclass
@@ -37,6 +48,7 @@ class SendEmailResponse:
     """Response from the send email API."""
     
     message: str
+    recipients: Optional[List[RecipientStatus]] = None
 
 
 @dataclass
@@ -44,4 +56,35 @@ class FreesendConfig:
     """Configuration for the Freesend client."""
     
     api_key: str
-    base_url: Optional[str] = None 
\ No newline at end of file
+    base_url: Optional[str] = None
+    transport: Optional[str] = None  # "requests" (default), "http.client" (standard library only) or "http2"
+    max_concurrent_streams: Optional[int] = None  # http2 only: maximum requests in flight (default 100)
+    http2_prior_knowledge: bool = False  # http2 only: speak HTTP/2 without negotiation (cleartext h2c servers)
+
+
+@dataclass
+class ValidationReport:
+    """Result of validating a batch of requests with validate_many."""
+
+    total: int = 0
+    invalid: int = 0
+    errors: Dict[int, List[str]] = field(default_factory=dict)  # row index -> error messages
+
+    @property
+    def valid(self) -> int:
+        return self.total - self.invalid
+
+    @property
+    def ok(self) -> bool:
+        return self.invalid == 0
+
+    def summary(self, limit: int = 10) -> str:
+        """Human-readable summary listing the first ``limit`` invalid rows."""
+        lines = [f"{self.total} checked, {self.valid} valid, {self.invalid} invalid"]
+        for index, errors in islice(self.errors.items(), limit):
+            lines.append(f"  row {index}: {'; '.join(errors)}")
+        # Rows beyond max_errors are counted but have no details to list
+        shown = len(lines) - 1
+        if self.invalid > shown:
+            lines.append(f"  ... and {self.invalid - shown} more")
+        return "\n".join(lines)
@@ -0,0 +1,394 @@
+"""
+Request validation for the Freesend Python SDK.
+
+The rules mirror the checks made by the /api/send-email route, so a
+request that passes here is not rejected by the server for its shape.
+``validate_many`` runs them over large batches before anything is sent
+and collects every problem per row instead of stopping at the first.
+"""
+
+import os
+import re
+from collections import deque
+from email.utils import getaddresses
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+from urllib.parse import urlsplit
+
+from .types import Attachment, SendEmailRequest, ValidationReport
+
+FAN_OUT_MODES = ("single", "separate")
+MAX_RECIPIENTS = 1000
+
+STRING_FIELDS = ("fromEmail", "fromName", "subject", "text", "html", "replyTo", "fanOut")
+RECIPIENT_FIELDS = ("to", "cc", "bcc")
+ATTACHMENT_FIELDS = ("filename", "content", "url", "contentType")
+
+EMAIL_RE = re.compile(r"[^\s@]+@[^\s@]+\.[^\s@]+")
+BASE64_RE = re.compile(r"[A-Za-z0-9+/]*={0,2}")
+
+# Attachment URL rules enforced by the server to block internal resources
+BLOCKED_HOSTS = frozenset(("localhost", "127.0.0.1", "::1", "0.0.0.0"))
+BLOCKED_HOST_PREFIXES = ("192.168.", "10.", "172.", "169.254.")
+BLOCKED_HOST_SUFFIXES = (".local", ".internal", ".home", ".lan")
+BLOCKED_PORTS = frozenset((
+    21, 22, 23, 25, 53, 80, 110, 143, 443, 993, 995, 3306, 5432, 6379, 8080, 8443,
+))
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def _format_recipient(name: str, address: str) -> str:
+    if not name:
+        return address
+    escaped = name.replace('"', '\\"')
+    return f'"{escaped}" <{address}>'
+
+
+def _parse_recipients(
+    value: Optional[Union[str, List[str]]],
+    seen: Optional[Set[str]] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Parse a recipient field into (entry, address) pairs, one per recipient.
+
+    ``entry`` is what is sent to the server: the original string when it
+    holds a single recipient, otherwise that recipient re-formatted.
+    ``address`` is the bare address (empty if none could be parsed).
+    """
+    if not value:
+        return []
+    if seen is None:
+        seen = set()
+
+    recipients = []
+    for entry in [value] if isinstance(value, str) else value:
+        parsed = [(name, address) for name, address in getaddresses([entry]) if name or address]
+        for name, address in parsed:
+            key = address.lower()
+            if address and key in seen:
+                continue
+            if address:
+                seen.add(key)
+            text = entry.strip(" \t\r\n,") if len(parsed) == 1 else _format_recipient(name, address)
+            recipients.append((text, address))
+    return recipients
+
+
+def normalize_recipients(
+    value: Optional[Union[str, List[str]]],
+    seen: Optional[Set[str]] = None,
+) -> List[str]:
+    """
+    Flatten a recipient field into a list of unique recipients.
+
+    Entries are parsed like the server does, so they may carry a display
+    name ("Jane <jane@example.com>", or '"Doe, Jane" <jane@example.com>'
+    with a comma inside quotes) and a string may hold several
+    comma-separated recipients. Duplicates are compared on the bare
+    address, case-insensitively, keeping the first occurrence.
+
+    Args:
+        value: A single recipient, comma-separated recipients or a list of them
+        seen: Lowercased addresses already used in another field; updated in place
+
+    Returns:
+        List of unique recipients, each with its display name if it had one
+    """
+    return [entry for entry, _ in _parse_recipients(value, seen)]
+
+
+def _validate_attachment_url(filename: str, url: str, host: Optional[str]) -> Optional[str]:
+    try:
+        parts = urlsplit(url)
+        hostname = (parts.hostname or "").lower()
+        port = parts.port
+    except ValueError:
+        return f"Attachment '{filename}' has invalid URL format"
+
+    if parts.scheme not in ("http", "https"):
+        if not parts.scheme or not parts.netloc:
+            return f"Attachment '{filename}' has invalid URL format"
+        return f"Attachment '{filename}' has invalid URL protocol. Only HTTP and HTTPS are allowed"
+    if not hostname:
+        return f"Attachment '{filename}' has invalid URL format"
+
+    if (
+        hostname in BLOCKED_HOSTS
+        or hostname.startswith(BLOCKED_HOST_PREFIXES)
+        or hostname.endswith(BLOCKED_HOST_SUFFIXES)
+    ):
+        return f"Attachment '{filename}' URL is not allowed. Internal/local URLs are blocked"
+
+    # The server only sees an explicit, non-default port
+    if port is not None and port != DEFAULT_PORTS[parts.scheme] and port in BLOCKED_PORTS:
+        return f"Attachment '{filename}' URL port is not allowed. Internal service ports are blocked"
+
+    if host and (hostname == host or hostname.endswith("." + host)):
+        return f"Attachment '{filename}' URL is not allowed. Access to the hosting server is blocked"
+
+    return None
+
+
+def _type_name(value: object) -> str:
+    return type(value).__name__
+
+
+def _type_errors(data: SendEmailRequest) -> List[str]:
+    """Check field types, so malformed rows are reported instead of raising."""
+    errors = []
+
+    for name in STRING_FIELDS:
+        value = getattr(data, name)
+        if value is not None and not isinstance(value, str):
+            errors.append(f"{name} must be a string, got {_type_name(value)}")
+
+    for name in RECIPIENT_FIELDS:
+        value = getattr(data, name)
+        if value is None or isinstance(value, str):
+            continue
+        if not isinstance(value, (list, tuple)):
+            errors.append(f"{name} must be a string or a list of strings, got {_type_name(value)}")
+            continue
+        for index, entry in enumerate(value):
+            if not isinstance(entry, str):
+                errors.append(f"{name}[{index}] must be a string, got {_type_name(entry)}")
+
+    attachments = data.attachments
+    if attachments is not None and not isinstance(attachments, (list, tuple)):
+        errors.append(f"attachments must be a list of Attachment, got {_type_name(attachments)}")
+    elif attachments:
+        for index, attachment in enumerate(attachments):
+            if not isinstance(attachment, Attachment):
+                errors.append(f"attachments[{index}] must be an Attachment, got {_type_name(attachment)}")
+                continue
+            for name in ATTACHMENT_FIELDS:
+                value = getattr(attachment, name)
+                if value is not None and not isinstance(value, str):
+                    errors.append(f"attachments[{index}].{name} must be a string, got {_type_name(value)}")
+
+    return errors
+
+
+def validate_request(data: SendEmailRequest, host: Optional[str] = None) -> List[str]:
+    """
+    Check one request against the server's rules.
+
+    Values of the wrong type are reported as errors rather than raising; the
+    remaining checks only run once every field has the expected type.
+
+    Args:
+        data: Email request data
+        host: Hostname of the Freesend server; attachment URLs pointing at it
+            are rejected like the server does
+
+    Returns:
+        Every validation error found, in check order (empty if valid)
+    """
+    if not isinstance(data, SendEmailRequest):
+        return [f"Request must be a SendEmailRequest, got {_type_name(data)}"]
+    errors = _type_errors(data)
+    if errors:
+        return errors
+
+    if not data.fromEmail:
+        errors.append("Missing required field: fromEmail")
+    if not data.to:
+        errors.append("Missing required field: to")
+    if not data.subject:
+        errors.append("Missing required field: subject")
+    if not data.text and not data.html:
+        errors.append("Missing required field: text or html")
+
+    if data.fromEmail and not EMAIL_RE.fullmatch(data.fromEmail):
+        errors.append("Invalid fromEmail format")
+
+    seen: Set[str] = set()
+    to = _parse_recipients(data.to, seen)
+    cc = _parse_recipients(data.cc, seen)
+    bcc = _parse_recipients(data.bcc, seen)
+    if data.to and not to:
+        errors.append("Missing required field: to")
+
+    for field, recipients in (("to", to), ("cc", cc), ("bcc", bcc)):
+        for entry, address in recipients:
+            if not EMAIL_RE.fullmatch(address):
+                errors.append(f"Invalid {field} email format: {entry}")
+
+    if len(to) + len(cc) + len(bcc) > MAX_RECIPIENTS:
+        errors.append(f"Too many recipients. A maximum of {MAX_RECIPIENTS} is allowed")
+
+    if data.fanOut is not None and data.fanOut not in FAN_OUT_MODES:
+        errors.append("fanOut must be 'single' or 'separate'")
+    if data.fanOut == "separate" and (cc or bcc):
+        errors.append("cc and bcc are not supported with fanOut 'separate'")
+
+    if data.replyTo and not EMAIL_RE.fullmatch(data.replyTo):
+        errors.append("Invalid replyTo email format")
+
+    for attachment in data.attachments or ():
+        if not attachment.filename:
+            errors.append("Attachment filename is required")
+        if not attachment.content and not attachment.url:
+            errors.append("Attachment must have either content or url")
+            continue
+        if attachment.content and attachment.url:
+            errors.append("Attachment cannot have both content and url")
+            continue
+        if attachment.content:
+            if not BASE64_RE.fullmatch(attachment.content):
+                errors.append(f"Attachment '{attachment.filename}' has invalid base64 content")
+        else:
+            error = _validate_attachment_url(attachment.filename, attachment.url, host)
+            if error:
+                errors.append(error)
+
+    return errors
+
+
+def _validate_chunk(
+    chunk: Sequence[SendEmailRequest], host: Optional[str]
+) -> List[Tuple[int, List[str]]]:
+    """Validate a chunk, returning (position in chunk, errors) for invalid requests."""
+    invalid = []
+    for position, data in enumerate(chunk):
+        errors = validate_request(data, host)
+        if errors:
+            invalid.append((position, errors))
+    return invalid
+
+
+def _to_row(data: SendEmailRequest) -> Optional[tuple]:
+    """
+    Flatten a request into a plain tuple of all of its fields.
+
+    Tuples pickle several times faster than dataclasses, which is what keeps
+    the parent process from becoming the bottleneck of a parallel run.
+    Returns None for anything that can't be flattened; it is sent as is.
+    """
+    if type(data) is not SendEmailRequest:
+        return None
+    attachments = data.attachments
+    if attachments:
+        if type(attachments) is not list or any(type(a) is not Attachment for a in attachments):
+            return None
+        attachments = [(a.filename, a.content, a.url, a.contentType) for a in attachments]
+    # Same order as the dataclass fields, so _from_row can pass them positionally
+    return (
+        data.fromEmail, data.to, data.subject, data.fromName, data.text, data.html,
+        data.replyTo, data.cc, data.bcc, attachments, data.fanOut,
+    )
+
+
+def _from_row(row: tuple) -> SendEmailRequest:
+    data = SendEmailRequest(*row)
+    if data.attachments:
+        data.attachments = [Attachment(*attachment) for attachment in data.attachments]
+    return data
+
+
+def _pack_chunk(chunk: Sequence[SendEmailRequest]) -> Tuple[List[Optional[tuple]], Dict[int, object]]:
+    rows = [_to_row(data) for data in chunk]
+    originals = {position: chunk[position] for position, row in enumerate(rows) if row is None}
+    return rows, originals
+
+
+def _validate_packed(
+    rows: List[Optional[tuple]], originals: Dict[int, object], host: Optional[str]
+) -> List[Tuple[int, List[str]]]:
+    """Worker entry point: validate a chunk produced by _pack_chunk."""
+    chunk = [
+        originals[position] if row is None else _from_row(row)
+        for position, row in enumerate(rows)
+    ]
+    return _validate_chunk(chunk, host)
+
+
+def _record(
+    report: ValidationReport,
+    offset: int,
+    size: int,
+    invalid: List[Tuple[int, List[str]]],
+    max_errors: Optional[int],
+) -> None:
+    report.total += size
+    for position, errors in invalid:
+        report.invalid += 1
+        if max_errors is None or len(report.errors) < max_errors:
+            report.errors[offset + position] = errors
+
+
+def validate_many(
+    requests: Iterable[SendEmailRequest],
+    host: Optional[str] = None,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_errors: Optional[int] = None,
+) -> ValidationReport:
+    """
+    Validate a batch of requests without sending anything.
+
+    Requests are consumed in chunks, so any iterable (including a generator
+    over a very large file) can be checked in a single pass.
+
+    Validation runs in the calling process by default. With ``workers`` > 1,
+    inputs larger than one chunk are spread over a process pool; this only
+    pays off on machines with several idle cores, needs a platform with
+    multiprocessing support (not AWS Lambda) and, where processes are
+    spawned (Windows, macOS), a ``if __name__ == "__main__":`` guard in the
+    calling script.
+
+    Args:
+        requests: Requests to validate
+        host: Hostname of the Freesend server, see validate_request
+        workers: Worker processes (capped at the number of CPUs); 1, the
+            default, disables parallelism
+        chunk_size: Requests handed to a worker at a time
+        max_errors: Keep details for at most this many invalid rows (all
+            invalid rows are still counted)
+
+    Returns:
+        ValidationReport with counts and per-row errors keyed by row index
+
+    Raises:
+        ValueError: If chunk_size is less than 1
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+    report = ValidationReport()
+    iterator = iter(requests)
+    workers = min(workers, os.cpu_count() or 1)
+
+    def next_chunk() -> List[SendEmailRequest]:
+        return list(islice(iterator, chunk_size))
+
+    chunk = next_chunk()
+    offset = 0
+
+    if workers <= 1 or len(chunk) < chunk_size:
+        while chunk:
+            _record(report, offset, len(chunk), _validate_chunk(chunk, host), max_errors)
+            offset += len(chunk)
+            chunk = next_chunk()
+        return report
+
+    # Imported here so that building a client doesn't load multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Keep a bounded number of chunks in flight and merge them in order
+    pending: deque = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while chunk:
+            pending.append((offset, len(chunk), executor.submit(_validate_packed, *_pack_chunk(chunk), host)))
+            offset += len(chunk)
+            if len(pending) >= workers * 2:
+                start, size, future = pending.popleft()
+                _record(report, start, size, future.result(), max_errors)
+            chunk = next_chunk()
+        while pending:
+            start, size, future = pending.popleft()
+            _record(report, start, size, future.result(), max_errors)
+
+    return report
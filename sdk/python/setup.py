@@ -33,6 +33,9 @@ setup(
         "requests>=2.25.0",
     ],
     extras_require={
+        "http2": [
+            "httpx[http2]>=0.23.0",
+        ],
         "dev": [
             "pytest>=6.0.0",
             "pytest-asyncio>=0.18.0",
@@ -41,6 +44,11 @@ setup(
             "mypy>=0.800",
         ],
     },
+    entry_points={
+        "console_scripts": [
+            "freesend=freesend.cli:main",
+        ],
+    },
     keywords="freesend, email, api, smtp, python",
     project_urls={
         "Bug Reports": "https://github.com/mokshablr/Freesend/issues",
@@ -0,0 +1,178 @@
+"""
+Tests for the Freesend command-line bulk sender.
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from freesend import FreesendConfig
+from freesend.cli import MalformedRow, _shared_client, iter_rows, load_completed, main, render_request, run
+from freesend.exceptions import FreesendAPIError, FreesendError
+from freesend.transport import HTTP2Transport, _http2_available
+
+
+class TestFreesendCLI(unittest.TestCase):
+    """Test cases for the bulk-send CLI."""
+
+    def setUp(self):
+        """Set up a temporary directory for input and log files."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(content)
+        return path
+
+    def test_iter_rows_csv_and_jsonl(self):
+        """Test rows are read from CSV and JSONL files."""
+        csv_path = self._write("in.csv", "email,name\na@example.com,Ann\nb@example.com,Bob\n")
+        jsonl_path = self._write("in.jsonl", '{"email": "a@example.com"}\n\n{"email": "b@example.com"}\n')
+
+        self.assertEqual([r["name"] for r in iter_rows(csv_path)], ["Ann", "Bob"])
+        self.assertEqual([r["email"] for r in iter_rows(jsonl_path)], ["a@example.com", "b@example.com"])
+
+    def test_iter_rows_skips_byte_order_mark(self):
+        """Test a UTF-8 byte-order mark (as in Excel exports) is not part of the first column."""
+        csv_path = self._write("bom.csv", "\ufeffto,name\na@example.com,Ann\n")
+        jsonl_path = self._write("bom.jsonl", '\ufeff{"to": "a@example.com"}\n')
+
+        rows = list(iter_rows(csv_path))
+        self.assertEqual(rows, [{"to": "a@example.com", "name": "Ann"}])
+        request = render_request(rows[0], {"fromEmail": "me@example.com", "subject": "Hi", "text": "Hi"})
+        self.assertEqual(request.to, "a@example.com")
+        self.assertEqual(list(iter_rows(jsonl_path)), [{"to": "a@example.com"}])
+
+    def test_iter_rows_malformed_jsonl(self):
+        """Test a malformed JSONL line is yielded as a MalformedRow, not raised."""
+        path = self._write("in.jsonl", '{"email": "a@example.com"}\n{not json\n[1]\n{"email": "b@example.com"}\n')
+        rows = list(iter_rows(path))
+        self.assertEqual(len(rows), 4)
+        self.assertIsInstance(rows[1], MalformedRow)
+        self.assertIsInstance(rows[2], MalformedRow)
+        self.assertEqual(rows[3]["email"], "b@example.com")
+
+    def test_render_request_templates_and_columns(self):
+        """Test templated fields are rendered and others come from columns."""
+        row = {"email": "a@example.com", "name": "Ann", "fromEmail": "me@example.com", "text": "Hi"}
+        request = render_request(row, {"to": "{{email}}", "subject": "Hello {{ name }}"})
+
+        self.assertEqual(request.to, "a@example.com")
+        self.assertEqual(request.subject, "Hello Ann")
+        self.assertEqual(request.fromEmail, "me@example.com")
+        self.assertEqual(request.text, "Hi")
+        self.assertIsNone(request.html)
+
+    def test_render_request_missing_column(self):
+        """Test a template referencing a missing column raises a clear error."""
+        with self.assertRaises(FreesendError) as context:
+            render_request({"email": "a@example.com"}, {"subject": "Hello {{name}}"})
+        self.assertIn("name", str(context.exception))
+
+    def test_render_request_leaves_single_braces(self):
+        """Test literal braces in HTML/CSS are not treated as placeholders."""
+        html = "<style>body { color: red; }</style><p>Hi {{name}}</p>"
+        request = render_request({"name": "Ann"}, {"html": html})
+        self.assertEqual(request.html, "<style>body { color: red; }</style><p>Hi Ann</p>")
+
+    def test_render_request_does_not_evaluate_lookups(self):
+        """Test attribute lookups are treated as plain (missing) column names."""
+        with self.assertRaises(FreesendError) as context:
+            render_request({"x": "value"}, {"subject": "{{x.__class__}}"})
+        self.assertIn("x.__class__", str(context.exception))
+
+    def test_shared_client_only_for_http2(self):
+        """Test workers share a client only when it multiplexes over HTTP/2."""
+        self.assertIsNone(_shared_client(FreesendConfig(api_key="test")))
+        if _http2_available():
+            client = _shared_client(FreesendConfig(api_key="test", transport="http2"))
+            self.assertIsInstance(client.transport, HTTP2Transport)
+
+    @patch("freesend.transport._http2_available", return_value=False)
+    def test_shared_client_not_used_after_fallback(self, _):
+        """Test http2 falling back to requests gives each worker its own client."""
+        with self.assertWarns(RuntimeWarning):
+            self.assertIsNone(_shared_client(FreesendConfig(api_key="test", transport="http2")))
+
+    @patch("freesend.cli.Freesend.send_email")
+    def test_run_logs_each_row(self, mock_send):
+        """Test every row's outcome is written to the result log."""
+        mock_send.side_effect = [None, FreesendAPIError("Invalid API key", 401), None]
+        rows = iter([
+            {"to": "a@example.com"},
+            {"to": "b@example.com"},
+            {"to": "c@example.com"},
+        ])
+        templates = {"fromEmail": "me@example.com", "subject": "Hi", "text": "Hi"}
+        log = io.StringIO()
+
+        progress = run(rows, FreesendConfig(api_key="test"), templates, log, concurrency=1)
+
+        entries = sorted(
+            (json.loads(line) for line in log.getvalue().splitlines()),
+            key=lambda entry: entry["row"],
+        )
+        self.assertEqual([e["status"] for e in entries], ["sent", "failed", "sent"])
+        self.assertEqual(entries[1]["error"], "Invalid API key")
+        self.assertEqual((progress.sent, progress.failed), (2, 1))
+
+    @patch("freesend.cli.Freesend.send_email")
+    def test_run_logs_malformed_row_and_continues(self, mock_send):
+        """Test a malformed row is logged as failed while later rows are sent."""
+        rows = iter([MalformedRow("Invalid JSON: oops"), {"to": "b@example.com"}])
+        templates = {"fromEmail": "me@example.com", "subject": "Hi", "text": "Hi"}
+        log = io.StringIO()
+
+        progress = run(rows, FreesendConfig(api_key="test"), templates, log, concurrency=1)
+
+        entries = {e["row"]: e for e in map(json.loads, log.getvalue().splitlines())}
+        self.assertEqual(entries[1]["status"], "failed")
+        self.assertEqual(entries[1]["error"], "Invalid JSON: oops")
+        self.assertEqual(entries[2]["status"], "sent")
+        self.assertEqual((progress.sent, progress.failed), (1, 1))
+
+    def test_refuses_to_overwrite_existing_log(self):
+        """Test a non-empty log is not replaced without --resume or --overwrite."""
+        input_path = self._write("in.csv", "to\na@example.com\n")
+        log_path = self._write("log.jsonl", '{"row": 1, "status": "sent"}\n')
+        with patch("sys.stderr", io.StringIO()), self.assertRaises(SystemExit):
+            main([input_path, "--api-key", "test", "--log", log_path])
+        with open(log_path, encoding="utf-8") as handle:
+            self.assertEqual(handle.read(), '{"row": 1, "status": "sent"}\n')
+
+    @patch("freesend.cli.Freesend.send_email")
+    def test_resume_skips_sent_rows(self, mock_send):
+        """Test --resume does not re-send rows already logged as sent."""
+        input_path = self._write(
+            "in.csv",
+            "to\na@example.com\nb@example.com\nc@example.com\n",
+        )
+        log_path = self._write(
+            "log.jsonl",
+            '{"row": 1, "status": "sent"}\n{"row": 2, "status": "failed"}\n{"row": 3, "sta',
+        )
+        self.assertEqual(load_completed(log_path), {1})
+
+        exit_code = main([
+            input_path,
+            "--api-key", "test",
+            "--log", log_path,
+            "--resume",
+            "--from-email", "me@example.com",
+            "--subject", "Hi",
+            "--text", "Hi",
+        ])
+
+        self.assertEqual(exit_code, 0)
+        sent_to = sorted(call.args[0].to for call in mock_send.call_args_list)
+        self.assertEqual(sent_to, ["b@example.com", "c@example.com"])
+        self.assertEqual(load_completed(log_path), {1, 2, 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
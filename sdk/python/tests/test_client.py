@@ -253,6 +253,98 @@ class TestFreesendClient(unittest.TestCase):
             self.client.send_email(email_data)
         self.assertIn("Invalid JSON", str(context.exception))
 
+    def test_prepare_payload_deduplicates_recipients(self):
+        """Test recipient lists are normalized and deduplicated across fields."""
+        email_data = SendEmailRequest(
+            fromEmail="test@example.com",
+            to=["a@example.com", " A@example.com", "b@example.com"],
+            subject="Test",
+            text="Test",
+            cc="b@example.com, c@example.com",
+            bcc=["a@example.com"],
+        )
+        payload = self.client._prepare_payload(email_data)
+        self.assertEqual(payload["to"], ["a@example.com", "b@example.com"])
+        self.assertEqual(payload["cc"], "c@example.com")
+        self.assertNotIn("bcc", payload)
+
+    def test_prepare_payload_keeps_display_names(self):
+        """Test named recipients are validated on their address and sent as given."""
+        email_data = SendEmailRequest(
+            fromEmail="test@example.com",
+            to="Jane <jane@example.com>",
+            subject="Test",
+            text="Test",
+            cc=['"Doe, John" <john@example.com>', "jane@example.com"],
+        )
+        self.client._validate_email_data(email_data)
+        payload = self.client._prepare_payload(email_data)
+        self.assertEqual(payload["to"], "Jane <jane@example.com>")
+        self.assertEqual(payload["cc"], '"Doe, John" <john@example.com>')
+
+    def test_prepare_payload_splits_string_outside_quotes(self):
+        """Test a comma inside a quoted display name does not split the recipient."""
+        email_data = SendEmailRequest(
+            fromEmail="test@example.com",
+            to='"Doe, Jane" <jane@example.com>, Bob <bob@example.com>, JANE@example.com',
+            subject="Test",
+            text="Test",
+        )
+        self.client._validate_email_data(email_data)
+        payload = self.client._prepare_payload(email_data)
+        self.assertEqual(payload["to"], ['"Doe, Jane" <jane@example.com>', '"Bob" <bob@example.com>'])
+
+    def test_validation_invalid_recipient_in_list(self):
+        """Test every recipient in a list is validated."""
+        email_data = SendEmailRequest(
+            fromEmail="test@example.com",
+            to=["a@example.com", "not-an-email"],
+            subject="Test",
+            text="Test"
+        )
+        with self.assertRaises(FreesendValidationError) as context:
+            self.client.send_email(email_data)
+        self.assertIn("not-an-email", str(context.exception))
+
+    def test_validation_separate_fan_out_rejects_cc(self):
+        """Test cc/bcc cannot be combined with separate fan-out."""
+        email_data = SendEmailRequest(
+            fromEmail="test@example.com",
+            to=["a@example.com", "b@example.com"],
+            subject="Test",
+            text="Test",
+            cc="c@example.com",
+            fanOut="separate",
+        )
+        with self.assertRaises(FreesendValidationError) as context:
+            self.client.send_email(email_data)
+        self.assertIn("fanOut", str(context.exception))
+
+    @patch('freesend.client.requests.Session.post')
+    def test_send_email_recipient_statuses(self, mock_post):
+        """Test per-recipient statuses are parsed from the response."""
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.json.return_value = {
+            "message": "Email sent to 1 of 2 recipients",
+            "recipients": [
+                {"email": "a@example.com", "status": "sent"},
+                {"email": "b@example.com", "status": "failed", "error": "Mailbox unavailable"},
+            ],
+        }
+        mock_post.return_value = mock_response
+        email_data = SendEmailRequest(
+            fromEmail="test@example.com",
+            to=["a@example.com", "b@example.com"],
+            subject="Test",
+            text="Test",
+            fanOut="separate",
+        )
+        response = self.client.send_email(email_data)
+        self.assertEqual([r.status for r in response.recipients], ["sent", "failed"])
+        self.assertEqual(response.recipients[1].error, "Mailbox unavailable")
+        self.assertEqual(mock_post.call_args.kwargs["json"]["fanOut"], "separate")
+
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
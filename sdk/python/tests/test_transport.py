@@ -0,0 +1,312 @@
+"""
+Tests for the Freesend HTTP transports and lazy package imports.
+"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from freesend import Freesend, SendEmailRequest, FreesendConfig
+from freesend.exceptions import FreesendAPIError, FreesendError, FreesendNetworkError
+from freesend.transport import RequestsTransport, _http2_available
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests_seen = []
+    in_flight = 0
+    peak_in_flight = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.requests_seen.append((self.path, self.headers["Authorization"], json.loads(body)))
+        if self.headers["Authorization"] == "Bearer slow":
+            # Answer late, recording how many requests overlap
+            cls = type(self)
+            with cls.lock:
+                cls.in_flight += 1
+                cls.peak_in_flight = max(cls.peak_in_flight, cls.in_flight)
+            time.sleep(0.2)
+            with cls.lock:
+                cls.in_flight -= 1
+        if self.headers["Authorization"] == "Bearer drop-after-read":
+            # Read the whole request, then hang up without answering
+            self.close_connection = True
+            return
+        if self.headers["Authorization"] == "Bearer bad-key":
+            status, result = 403, {"error": "Invalid API Key or no SMTP configuration found."}
+        else:
+            status, result = 200, {"message": "Email sent successfully"}
+        data = json.dumps(result).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        if self.headers["Authorization"] == "Bearer close-when-idle":
+            # Keep-alive was advertised, but the server drops the idle socket
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _LocalServerTestCase(unittest.TestCase):
+    """Runs a local HTTP/1.1 stand-in for the API."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _Handler.requests_seen = []
+        _Handler.peak_in_flight = 0
+        self.email_data = SendEmailRequest(
+            fromEmail="test@example.com",
+            to="recipient@example.com",
+            subject="Test",
+            text="Test"
+        )
+
+
+class TestHTTPClientTransport(_LocalServerTestCase):
+    """Test cases for the standard library transport."""
+
+    def test_send_email_reuses_connection(self):
+        """Test emails are sent over one keep-alive connection."""
+        client = Freesend(FreesendConfig(api_key="test-key", base_url=self.base_url, transport="http.client"))
+
+        for _ in range(3):
+            response = client.send_email(self.email_data)
+            self.assertEqual(response.message, "Email sent successfully")
+
+        self.assertEqual(len(_Handler.requests_seen), 3)
+        path, auth, payload = _Handler.requests_seen[0]
+        self.assertEqual(path, "/api/send-email")
+        self.assertEqual(auth, "Bearer test-key")
+        self.assertEqual(payload["to"], "recipient@example.com")
+        self.assertIsNotNone(client.transport.connection)
+        self.assertIsNone(client.session)
+
+    def test_reconnects_after_idle_close(self):
+        """Test a keep-alive socket closed by the server is replaced, not reused."""
+        client = Freesend(FreesendConfig(api_key="close-when-idle", base_url=self.base_url, transport="http.client"))
+        for _ in range(3):
+            self.assertEqual(client.send_email(self.email_data).message, "Email sent successfully")
+            # Stay idle until the server's close has arrived; a request racing
+            # the close is never resent, by design
+            time.sleep(0.1)
+        self.assertEqual(len(_Handler.requests_seen), 3)
+
+    def test_no_resend_after_request_was_sent(self):
+        """Test a failure after the request was fully sent is not retried."""
+        client = Freesend(FreesendConfig(api_key="test-key", base_url=self.base_url, transport="http.client"))
+        client.send_email(self.email_data)
+        client.transport.headers = dict(client.transport.headers, Authorization="Bearer drop-after-read")
+
+        with self.assertRaises(FreesendNetworkError):
+            client.send_email(self.email_data)
+        self.assertEqual(len(_Handler.requests_seen), 2)
+
+    def test_send_email_api_error(self):
+        """Test API errors are raised with the status code."""
+        client = Freesend(FreesendConfig(api_key="bad-key", base_url=self.base_url, transport="http.client"))
+        with self.assertRaises(FreesendAPIError) as context:
+            client.send_email(self.email_data)
+        self.assertEqual(context.exception.status_code, 403)
+
+    def test_send_email_network_error(self):
+        """Test connection failures raise FreesendNetworkError."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        client = Freesend(FreesendConfig(api_key="test-key", base_url=f"http://127.0.0.1:{port}", transport="http.client"))
+        with self.assertRaises(FreesendNetworkError):
+            client.send_email(self.email_data)
+
+    def test_unknown_transport(self):
+        """Test an unknown transport name is rejected."""
+        with self.assertRaises(FreesendError) as context:
+            Freesend(FreesendConfig(api_key="test-key", transport="carrier-pigeon"))
+        self.assertIn("carrier-pigeon", str(context.exception))
+
+
+@unittest.skipUnless(_http2_available(), "httpx[http2] is not installed")
+class TestHTTP2Transport(_LocalServerTestCase):
+    """Test cases for the HTTP/2 transport."""
+
+    def test_falls_back_to_http1(self):
+        """Test the HTTP/2 transport still works against an HTTP/1.1-only server."""
+        client = Freesend(FreesendConfig(
+            api_key="test-key",
+            base_url=self.base_url,
+            transport="http2",
+            max_concurrent_streams=2,
+        ))
+        response = client.send_email(self.email_data)
+        self.assertEqual(response.message, "Email sent successfully")
+        self.assertEqual(_Handler.requests_seen[0][1], "Bearer test-key")
+
+    def test_http1_fallback_runs_requests_concurrently(self):
+        """Test the HTTP/1.1 fallback opens enough connections for every stream."""
+        client = Freesend(FreesendConfig(
+            api_key="slow",
+            base_url=self.base_url,
+            transport="http2",
+            max_concurrent_streams=8,
+        ))
+        threads = [threading.Thread(target=client.send_email, args=(self.email_data,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(_Handler.requests_seen), 8)
+        self.assertGreater(_Handler.peak_in_flight, 4)
+
+    def test_send_email_api_error(self):
+        """Test API errors are raised with the status code."""
+        client = Freesend(FreesendConfig(api_key="bad-key", base_url=self.base_url, transport="http2"))
+        with self.assertRaises(FreesendAPIError) as context:
+            client.send_email(self.email_data)
+        self.assertEqual(context.exception.status_code, 403)
+
+
+@unittest.skipUnless(_http2_available(), "requires freesend[http2]")
+class TestHTTP2Multiplexing(unittest.TestCase):
+    """Test cases for HTTP/2 against the benchmark's cleartext h2 stand-in."""
+
+    @classmethod
+    def setUpClass(cls):
+        package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        sys.path.insert(0, os.path.join(package_root, "benchmarks"))
+        try:
+            import http2_throughput
+        finally:
+            sys.path.pop(0)
+        cls.bench = http2_throughput
+
+    def setUp(self):
+        self.stats = self.bench.ServerStats()
+        self.base_url = self.bench.start_http2_server(0.1, self.stats)
+        self.email_data = SendEmailRequest(
+            fromEmail="test@example.com",
+            to="recipient@example.com",
+            subject="Test",
+            text="Test"
+        )
+
+    def _send_concurrently(self, client, count):
+        # Release every thread at once, so all requests are queued together
+        # and the server's stream counts don't depend on thread start-up
+        start = threading.Barrier(count)
+        results = []
+        errors = []
+
+        def send():
+            start.wait()
+            try:
+                results.append(client.send_email(self.email_data))
+            except FreesendError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=send) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        client.transport.close()
+        self.assertEqual(errors, [])
+        return results
+
+    def test_requests_share_one_connection(self):
+        """Test concurrent requests from many threads become streams on one socket."""
+        client = Freesend(FreesendConfig(
+            api_key="test-key",
+            base_url=self.base_url,
+            transport="http2",
+            http2_prior_knowledge=True,
+        ))
+        results = self._send_concurrently(client, 12)
+        self.assertEqual(len(results), 12)
+        self.assertEqual(self.stats.count, 1)
+        self.assertGreater(self.stats.peak_streams, 1)
+        self.assertFalse(client.transport.thread.is_alive())
+
+    def test_max_concurrent_streams_is_enforced(self):
+        """Test no more than max_concurrent_streams requests are in flight."""
+        client = Freesend(FreesendConfig(
+            api_key="test-key",
+            base_url=self.base_url,
+            transport="http2",
+            http2_prior_knowledge=True,
+            max_concurrent_streams=3,
+        ))
+        results = self._send_concurrently(client, 12)
+        self.assertEqual(len(results), 12)
+        self.assertEqual(self.stats.count, 1)
+        self.assertEqual(self.stats.peak_streams, 3)
+
+
+class TestHTTP2Fallback(unittest.TestCase):
+    """Test cases for selecting http2 without its optional dependencies."""
+
+    @patch("freesend.transport._http2_available", return_value=False)
+    def test_missing_dependencies_fall_back_to_requests(self, _):
+        """Test a warning is issued and the requests transport is used."""
+        with self.assertWarns(RuntimeWarning):
+            client = Freesend(FreesendConfig(api_key="test-key", transport="http2"))
+        self.assertIsInstance(client.transport, RequestsTransport)
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test cases for lazy package imports."""
+
+    def test_import_does_not_load_requests(self):
+        """Test importing the package and using the stdlib transport skips requests."""
+        code = (
+            "import sys, freesend\n"
+            "assert 'requests' not in sys.modules\n"
+            "freesend.Freesend(freesend.FreesendConfig(api_key='k', transport='http.client'))\n"
+            "assert 'requests' not in sys.modules\n"
+        )
+        package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=package_root)
+
+    def test_dir_lists_each_name_once(self):
+        """Test dir() does not repeat names that were already loaded lazily."""
+        import freesend
+
+        freesend.Freesend
+        names = dir(freesend)
+        self.assertEqual(len(names), len(set(names)))
+        self.assertIn("validate_many", names)
+
+    def test_client_does_not_load_multiprocessing(self):
+        """Test building a client skips the process pool used by validate_many."""
+        code = (
+            "import sys, freesend\n"
+            "freesend.Freesend(freesend.FreesendConfig(api_key='k', transport='http.client'))\n"
+            "assert 'multiprocessing' not in sys.modules, 'multiprocessing was imported'\n"
+        )
+        package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=package_root)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+"""
+Tests for batch validation in the Freesend Python SDK.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from freesend import Freesend, FreesendConfig, SendEmailRequest, Attachment, validate_many
+from freesend.validation import _from_row, _to_row, validate_request
+
+
+def _request(**overrides):
+    fields = dict(
+        fromEmail="test@example.com",
+        to="recipient@example.com",
+        subject="Test",
+        text="Test",
+    )
+    fields.update(overrides)
+    return SendEmailRequest(**fields)
+
+
+class TestValidateRequest(unittest.TestCase):
+    """Test cases for single-request validation rules."""
+
+    def test_valid_request(self):
+        """Test a valid request has no errors."""
+        self.assertEqual(validate_request(_request()), [])
+
+    def test_collects_all_errors(self):
+        """Test every problem is reported, not just the first."""
+        errors = validate_request(_request(fromEmail="bad", subject="", replyTo="also-bad"))
+        self.assertEqual(errors, [
+            "Missing required field: subject",
+            "Invalid fromEmail format",
+            "Invalid replyTo email format",
+        ])
+
+    def test_email_must_match_whole_string(self):
+        """Test a trailing newline is not accepted, matching the server's regex."""
+        self.assertEqual(validate_request(_request(replyTo="a@example.com\n")), ["Invalid replyTo email format"])
+
+    def test_attachment_base64(self):
+        """Test attachment content must be base64."""
+        errors = validate_request(_request(attachments=[Attachment(filename="f.txt", content="not base64!")]))
+        self.assertEqual(errors, ["Attachment 'f.txt' has invalid base64 content"])
+
+    def test_attachment_url_rules(self):
+        """Test attachment URLs follow the server's protocol, host and port rules."""
+        cases = {
+            "ftp://example.com/f.pdf": "protocol",
+            "http://localhost/f.pdf": "Internal/local",
+            "https://10.0.0.5/f.pdf": "Internal/local",
+            "https://files.example.com:8080/f.pdf": "port",
+            "https://cdn.freesend.metafog.io/f.pdf": "hosting server",
+            "not a url": "invalid URL format",
+        }
+        for url, expected in cases.items():
+            errors = validate_request(
+                _request(attachments=[Attachment(filename="f.pdf", url=url)]),
+                host="freesend.metafog.io",
+            )
+            self.assertEqual(len(errors), 1, url)
+            self.assertIn(expected, errors[0], url)
+
+        ok = _request(attachments=[Attachment(filename="f.pdf", url="https://example.com:443/f.pdf")])
+        self.assertEqual(validate_request(ok, host="freesend.metafog.io"), [])
+
+    def test_wrong_types_are_reported(self):
+        """Test malformed values become errors instead of raising."""
+        errors = validate_request(_request(
+            to=["x@y.com", None],
+            cc=5,
+            replyTo=b"a@example.com",
+            attachments=[{"filename": "f.txt"}, Attachment(filename="g.txt", content=123)],
+        ))
+        self.assertEqual(errors, [
+            "replyTo must be a string, got bytes",
+            "to[1] must be a string, got NoneType",
+            "cc must be a string or a list of strings, got int",
+            "attachments[0] must be an Attachment, got dict",
+            "attachments[1].content must be a string, got int",
+        ])
+        self.assertEqual(
+            validate_request({"to": "x@y.com"}),
+            ["Request must be a SendEmailRequest, got dict"],
+        )
+
+
+class TestValidateMany(unittest.TestCase):
+    """Test cases for batch validation."""
+
+    def _batch(self, size):
+        for i in range(size):
+            yield _request(to="bad" if i % 3 == 0 else f"user{i}@example.com")
+
+    def _batch_with_attachments(self, size):
+        for i in range(size):
+            yield _request(
+                to="bad" if i % 3 == 0 else f"user{i}@example.com",
+                fromName=123 if i % 5 == 0 else "Sender",
+                attachments=[Attachment(
+                    filename="a.txt",
+                    content="@@" if i % 4 == 0 else "aGk=",
+                    contentType=5 if i % 7 == 0 else "text/plain",
+                )],
+            )
+
+    def test_report_in_process(self):
+        """Test counts and per-row errors for a small batch."""
+        report = validate_many(self._batch(7), workers=1)
+        self.assertEqual((report.total, report.valid, report.invalid), (7, 4, 3))
+        self.assertEqual(list(report.errors), [0, 3, 6])
+        self.assertEqual(report.errors[3], ["Invalid to email format: bad"])
+        self.assertFalse(report.ok)
+        self.assertIn("7 checked, 4 valid, 3 invalid", report.summary())
+
+    @patch("freesend.validation.os.cpu_count", return_value=2)
+    def test_report_parallel_matches_in_process(self, _):
+        """Test the process pool gives the same report, in row order."""
+        serial = validate_many(self._batch_with_attachments(50), workers=1)
+        parallel = validate_many(self._batch_with_attachments(50), workers=2, chunk_size=7)
+        self.assertEqual(parallel, serial)
+        self.assertEqual(serial.errors[4], ["Attachment 'a.txt' has invalid base64 content"])
+        self.assertEqual(serial.errors[5], ["fromName must be a string, got int"])
+        self.assertEqual(serial.errors[7], ["attachments[0].contentType must be a string, got int"])
+
+    def test_rows_sent_to_workers_keep_every_field(self):
+        """Test requests flattened for the process pool are rebuilt unchanged."""
+        data = _request(
+            fromName="Sender",
+            html="<p>Hi</p>",
+            replyTo="reply@example.com",
+            cc=["cc@example.com"],
+            bcc="bcc@example.com",
+            fanOut="single",
+            attachments=[Attachment(filename="a.txt", url="https://example.com/a.txt", contentType="text/plain")],
+        )
+        self.assertEqual(_from_row(_to_row(data)), data)
+
+    @patch("concurrent.futures.ProcessPoolExecutor")
+    def test_process_pool_is_opt_in(self, mock_pool):
+        """Test large inputs are validated in process unless workers is set."""
+        report = validate_many(self._batch(50), chunk_size=7)
+        self.assertEqual(report.invalid, 17)
+        mock_pool.assert_not_called()
+
+    @patch("concurrent.futures.ProcessPoolExecutor")
+    @patch("freesend.validation.os.cpu_count", return_value=1)
+    def test_workers_capped_at_cpu_count(self, _, mock_pool):
+        """Test a process pool is never started on a single CPU."""
+        validate_many(self._batch(50), workers=4, chunk_size=7)
+        mock_pool.assert_not_called()
+
+    def test_max_errors(self):
+        """Test details are capped while every invalid row is counted."""
+        report = validate_many(self._batch(30), workers=1, max_errors=2)
+        self.assertEqual(report.invalid, 10)
+        self.assertEqual(list(report.errors), [0, 3])
+
+    @patch("freesend.validation.os.cpu_count", return_value=2)
+    def test_display_names_match_server_rules(self, _):
+        """Test recipients are checked on their parsed address, as the server does."""
+        rows = [
+            _request(to="Jane <jane@example.com>"),
+            _request(to='"Doe, Jane" <jane@example.com>, bob@example.com'),
+            _request(to=["Jane <jane@example.com>"], cc="Jane Doe"),
+        ] * 4
+        for workers in (1, 2):
+            report = validate_many(rows, workers=workers, chunk_size=5)
+            self.assertEqual(report.invalid, 4, workers)
+            self.assertEqual(report.errors[2], ["Invalid cc email format: Jane Doe"])
+
+    def test_chunk_size_must_be_positive(self):
+        """Test a chunk size below 1 is refused instead of checking nothing."""
+        for chunk_size in (0, -1):
+            with self.assertRaises(ValueError):
+                validate_many(self._batch(3), chunk_size=chunk_size)
+
+    def test_malformed_row_does_not_stop_batch(self):
+        """Test a row with wrong types is reported and the rest still checked."""
+        rows = [_request(), _request(to=["x@y.com", None]), _request(to="bad")]
+        report = validate_many(rows)
+        self.assertEqual(report.total, 3)
+        self.assertEqual(report.errors[1], ["to[1] must be a string, got NoneType"])
+        self.assertEqual(report.errors[2], ["Invalid to email format: bad"])
+
+    def test_summary_counts_rows_without_details(self):
+        """Test the summary's remainder covers rows dropped by max_errors."""
+        report = validate_many(self._batch(30), max_errors=2)
+        summary = report.summary(limit=10)
+        self.assertIn("row 3:", summary)
+        self.assertTrue(summary.endswith("... and 8 more"))
+        self.assertTrue(validate_many(self._batch(30)).summary(limit=4).endswith("... and 6 more"))
+
+    def test_client_uses_base_url_host(self):
+        """Test the client method blocks attachment URLs on its own host."""
+        client = Freesend(FreesendConfig(api_key="test-key", base_url="https://mail.example.org"))
+        report = client.validate_many([
+            _request(attachments=[Attachment(filename="f.pdf", url="https://mail.example.org/f.pdf")]),
+        ])
+        self.assertIn("hosting server", report.errors[0][0])
+
+
+if __name__ == "__main__":
+    unittest.main()